@@ -175,6 +175,9 @@ class AnnData(metaclass=utils.DeprecationMixinMeta):
         Name of backing file. See :class:`h5py.File`.
     filemode
         Open mode of backing file. See :class:`h5py.File`.
+    cache_size
+        Size of the chunk cache of the backing file in bytes.
+        See `rdcc_nbytes` of :class:`h5py.File`.
 
     See Also
     --------
@@ -282,6 +285,7 @@ class AnnData(metaclass=utils.DeprecationMixinMeta):
         varp: Optional[Union[np.ndarray, Mapping[str, Sequence[Any]]]] = None,
         oidx: Index1D = None,
         vidx: Index1D = None,
+        cache_size: Optional[int] = None,
     ):
         if asview:
             if not isinstance(X, AnnData):
@@ -303,6 +307,7 @@ class AnnData(metaclass=utils.DeprecationMixinMeta):
                 varp=varp,
                 filename=filename,
                 filemode=filemode,
+                cache_size=cache_size,
             )
 
     def _init_as_view(self, adata_ref: "AnnData", oidx: Index, vidx: Index):
@@ -382,6 +387,7 @@ class AnnData(metaclass=utils.DeprecationMixinMeta):
         shape=None,
         filename=None,
         filemode=None,
+        cache_size=None,
     ):
         # view attributes
         self._is_view = False
@@ -398,7 +404,7 @@ class AnnData(metaclass=utils.DeprecationMixinMeta):
 
         # init from file
         if filename is not None:
-            self.file = AnnDataFileManager(self, filename, filemode)
+            self.file = AnnDataFileManager(self, filename, filemode, cache_size)
         else:
             self.file = AnnDataFileManager(self, None)
 
@@ -1877,6 +1883,8 @@ class AnnData(metaclass=utils.DeprecationMixinMeta):
         compression_opts: Union[int, Any] = None,
         force_dense: Optional[bool] = None,
         as_dense: Sequence[str] = (),
+        downcast_float64: bool = False,
+        x_dtype: Optional[np.dtype] = None,
     ):
         """\
         Write `.h5ad`-formatted hdf5 file.
@@ -1903,10 +1911,22 @@ class AnnData(metaclass=utils.DeprecationMixinMeta):
             See the h5py :ref:`dataset_compression`.
         as_dense
             Sparse arrays in AnnData object to write as dense. Currently only
-            supports `X` and `raw/X`.
+            supports `X` and `raw/X`. They are densified in slabs of 1000 rows
+            (columns for CSC), of which up to `min(4, os.cpu_count())` are held
+            in memory at once. With gzip `compression`, these slabs are also
+            compressed in parallel. All other arrays are compressed by HDF5,
+            one chunk at a time.
         force_dense
             Write sparse data as a dense matrix.
             Defaults to `True` if object is backed, otherwise to `False`.
+        downcast_float64
+            Write `float64` arrays in :attr:`obsm`, :attr:`varm` and :attr:`uns`
+            as `float32`, halving their size on disk at the cost of precision.
+        x_dtype
+            Data type to write :attr:`X` as, e.g. `np.uint16` for count data
+            stored as floats. Casting to an integer type raises a :class:`ValueError`
+            if any value can’t be represented exactly. The original dtype is stored
+            in the `encoding-original-dtype` attribute of `X`.
         """
         from .._io.write import _write_h5ad
 
@@ -1922,6 +1942,8 @@ class AnnData(metaclass=utils.DeprecationMixinMeta):
             compression_opts=compression_opts,
             force_dense=force_dense,
             as_dense=as_dense,
+            downcast_float64=downcast_float64,
+            x_dtype=x_dtype,
         )
 
         if self.isbacked:
@@ -9,6 +9,15 @@ from . import anndata
 from .sparse_dataset import SparseDataset
 from ..compat import Literal, ZarrArray
 
+_CHUNK_CACHE_NSLOTS = 10007  # Should be prime, see H5Pset_chunk_cache
+
+
+def _chunk_cache_kwargs(cache_size: Optional[int]) -> dict:
+    """`h5py.File` arguments for a chunk cache of `cache_size` bytes."""
+    if cache_size is None:
+        return {}
+    return dict(rdcc_nbytes=cache_size, rdcc_nslots=_CHUNK_CACHE_NSLOTS)
+
 
 class AnnDataFileManager:
     """Backing file manager for AnnData."""
@@ -18,11 +27,14 @@ class AnnDataFileManager:
         adata: "anndata.AnnData",
         filename: Optional[PathLike] = None,
         filemode: Optional[Literal["r", "r+"]] = None,
+        cache_size: Optional[int] = None,
     ):
         self._adata = adata
         self.filename = filename
         self._filemode = filemode
         self._file = None
+        # Size of the HDF5 chunk cache in bytes, `None` for h5py’s default
+        self.cache_size = cache_size
         if filename:
             self.open()
 
@@ -68,7 +80,9 @@ class AnnDataFileManager:
             self._filemode = filemode
         if self.filename is None:
             raise ValueError("Cannot open backing file if backing not initialized.")
-        self._file = h5py.File(self.filename, self._filemode)
+        self._file = h5py.File(
+            self.filename, self._filemode, **_chunk_cache_kwargs(self.cache_size)
+        )
 
     def close(self):
         """Close the backing file, remember filename, do *not* change to memory mode."""
@@ -1,9 +1,14 @@
-import re
-from functools import partial
+import os
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
+from inspect import signature
 from warnings import warn
 from pathlib import Path
 from types import MappingProxyType
-from typing import Callable, Type, TypeVar, Union
+from typing import Callable, Iterator, List, NamedTuple, Optional, Tuple, Type
+from typing import TypeVar, Union
 from typing import Collection, Sequence, Mapping
 
 import h5py
@@ -12,11 +17,12 @@ import pandas as pd
 from scipy import sparse
 
 from .._core.sparse_dataset import SparseDataset
-from .._core.file_backing import AnnDataFileManager
+from .._core.file_backing import AnnDataFileManager, _chunk_cache_kwargs
 from .._core.anndata import AnnData
 from ..compat import (
     _from_fixed_length_strings,
-    _decode_structured_array,
+    _decode_structured_strings,
+    _sparse_upcast,
     _clean_uns,
     Literal,
 )
@@ -32,6 +38,38 @@ from anndata._warnings import OldFormatWarning
 
 T = TypeVar("T")
 
+# Smallest chunk cache used when reading, see `h5py.File`. h5py’s default cache of
+# 1 MiB is easily smaller than the chunks touched by a single slab of `X`, which
+# makes HDF5 read and decompress boundary chunks again for the following slab.
+_CHUNK_CACHE_MIN_NBYTES = 16 * 1024 * 1024
+
+# Objects of at least this size are aligned to multiples of it in newly written
+# files (H5Pset_alignment), so large slab I/O doesn’t straddle filesystem blocks.
+# Only h5py 3.7+ supports setting this.
+_ALIGNMENT = 1024 * 1024
+_H5PY_ALIGNMENT = "alignment_threshold" in signature(h5py.File.__init__).parameters
+
+# Native byte order dtypes numba can compile `_dense_chunk_nonzero_loop` for.
+# Others, like float16 or longdouble, are converted with numpy.
+_NUMBA_DTYPES = frozenset(
+    np.dtype(t)
+    for t in (
+        np.bool_,
+        np.int8,
+        np.int16,
+        np.int32,
+        np.int64,
+        np.uint8,
+        np.uint16,
+        np.uint32,
+        np.uint64,
+        np.float32,
+        np.float64,
+        np.complex64,
+        np.complex128,
+    )
+)
+
 
 def write_h5ad(
     filepath: Union[Path, str],
@@ -39,6 +77,8 @@ def write_h5ad(
     *,
     force_dense: bool = None,
     as_dense: Sequence[str] = (),
+    downcast_float64: bool = False,
+    x_dtype: Optional[np.dtype] = None,
     dataset_kwargs: Mapping = MappingProxyType({}),
     **kwargs,
 ) -> None:
@@ -47,6 +87,10 @@ def write_h5ad(
             "The `force_dense` argument is deprecated. Use `as_dense` instead.",
             FutureWarning,
         )
+    # Properties of `adata` are looked up once, as some of them do non-trivial work
+    is_backed = adata.isbacked
+    has_X = adata._has_X()
+    filename_matches = is_backed and Path(adata.filename) == Path(filepath)
     if force_dense is True:
         if adata.raw is not None:
             as_dense = ("X", "raw/X")
@@ -63,47 +107,92 @@ def write_h5ad(
         )
     if "raw/X" in as_dense and adata.raw is None:
         raise ValueError("Cannot specify writing `raw/X` to dense if it doesn’t exist.")
+    X_cast = None
+    if x_dtype is not None and has_X:
+        if is_backed:
+            raise NotImplementedError("`x_dtype` is not supported for backed objects.")
+        X = adata.X  # Builds the subset for views, so only do it once
+        X_cast, X_orig_dtype = _cast_exactly(X, x_dtype), X.dtype
 
     adata.strings_to_categoricals()
-    if adata.raw is not None:
-        adata.strings_to_categoricals(adata.raw.var)
+    # Only look these up now, as the call above turns views into actual objects
+    raw = adata.raw
+    is_view = adata.is_view
+    if raw is not None:
+        adata.strings_to_categoricals(raw.var)
     dataset_kwargs = {**dataset_kwargs, **kwargs}
     filepath = Path(filepath)
-    mode = "a" if adata.isbacked else "w"
-    if adata.isbacked:  # close so that we can reopen below
+    mode = "a" if is_backed else "w"
+    if is_backed:  # close so that we can reopen below
         adata.file.close()
-    with h5py.File(filepath, mode) as f:
+    file_kwargs = {}
+    if mode == "w" and _H5PY_ALIGNMENT:
+        file_kwargs.update(
+            alignment_threshold=_ALIGNMENT, alignment_interval=_ALIGNMENT
+        )
+    with h5py.File(filepath, mode, **file_kwargs) as f:
         # TODO: Use spec writing system for this
         f = f["/"]
         f.attrs.setdefault("encoding-type", "anndata")
         f.attrs.setdefault("encoding-version", "0.1.0")
 
-        if not adata.isbacked or adata._has_X():
-            if "X" in as_dense and isinstance(adata.X, (sparse.spmatrix, SparseDataset)):
-                write_sparse_as_dense(f, "X", adata.X, dataset_kwargs=dataset_kwargs)
-            elif not (adata.isbacked and Path(adata.filename) == Path(filepath)) or adata.is_view:
+        if has_X:
+            X = adata.X if X_cast is None else X_cast
+            if "X" in as_dense and isinstance(X, (sparse.spmatrix, SparseDataset)):
+                write_sparse_as_dense(f, "X", X, dataset_kwargs=dataset_kwargs)
+            elif not filename_matches or is_view:
                 # If adata.isbacked, X should already be up to date
-                write_elem(f, "X", adata.X, dataset_kwargs=dataset_kwargs)
-        if "raw/X" in as_dense and isinstance(
-            adata.raw.X, (sparse.spmatrix, SparseDataset)
-        ):
-            write_sparse_as_dense(
-                f, "raw/X", adata.raw.X, dataset_kwargs=dataset_kwargs
-            )
-            write_elem(f, "raw/var", adata.raw.var, dataset_kwargs=dataset_kwargs)
-            write_elem(
-                f, "raw/varm", dict(adata.raw.varm), dataset_kwargs=dataset_kwargs
-            )
-        elif adata.raw is not None:
-            write_elem(f, "raw", adata.raw, dataset_kwargs=dataset_kwargs)
+                write_elem(f, "X", X, dataset_kwargs=dataset_kwargs)
+            if X_cast is not None:
+                f["X"].attrs["encoding-original-dtype"] = str(X_orig_dtype)
+        if "raw/X" in as_dense and isinstance(raw.X, (sparse.spmatrix, SparseDataset)):
+            write_sparse_as_dense(f, "raw/X", raw.X, dataset_kwargs=dataset_kwargs)
+            write_elem(f, "raw/var", raw.var, dataset_kwargs=dataset_kwargs)
+            write_elem(f, "raw/varm", dict(raw.varm), dataset_kwargs=dataset_kwargs)
+        elif raw is not None:
+            write_elem(f, "raw", raw, dataset_kwargs=dataset_kwargs)
         write_elem(f, "obs", adata.obs, dataset_kwargs=dataset_kwargs)
         write_elem(f, "var", adata.var, dataset_kwargs=dataset_kwargs)
-        write_elem(f, "obsm", dict(adata.obsm), dataset_kwargs=dataset_kwargs)
-        write_elem(f, "varm", dict(adata.varm), dataset_kwargs=dataset_kwargs)
-        write_elem(f, "obsp", dict(adata.obsp), dataset_kwargs=dataset_kwargs)
-        write_elem(f, "varp", dict(adata.varp), dataset_kwargs=dataset_kwargs)
-        write_elem(f, "layers", dict(adata.layers), dataset_kwargs=dataset_kwargs)
-        write_elem(f, "uns", dict(adata.uns), dataset_kwargs=dataset_kwargs)
+        for k in ("obsm", "varm", "obsp", "varp", "layers", "uns"):
+            mapping = dict(getattr(adata, k))
+            if downcast_float64 and k in {"obsm", "varm", "uns"}:
+                mapping = _downcast_float64(mapping)
+            write_elem(f, k, mapping, dataset_kwargs=dataset_kwargs)
+
+
+def _cast_exactly(X: Union[np.ndarray, sparse.spmatrix], dtype: np.dtype):
+    """\
+    Cast the values of `X` to `dtype`, which must represent them exactly if integer.
+
+    Sparse matrices keep their index arrays, only the stored values are cast.
+    """
+    dtype = np.dtype(dtype)
+    data = X.data if isinstance(X, sparse.spmatrix) else np.asarray(X)
+    cast = data.astype(dtype)
+    if dtype.kind in "iu" and not np.array_equal(cast, data):
+        raise ValueError(
+            f"`X` contains values which can’t be represented exactly as {dtype}."
+        )
+    if sparse.isspmatrix_csr(X):
+        return sparse.csr_matrix((cast, X.indices, X.indptr), shape=X.shape)
+    elif sparse.isspmatrix_csc(X):
+        return sparse.csc_matrix((cast, X.indices, X.indptr), shape=X.shape)
+    elif isinstance(X, sparse.spmatrix):
+        return X.astype(dtype)
+    return cast
+
+
+def _downcast_float64(elem):
+    """Cast `float64` arrays and dataframe columns in (nested) mappings to `float32`."""
+    if isinstance(elem, Mapping):
+        return {k: _downcast_float64(v) for k, v in elem.items()}
+    elif isinstance(elem, (np.ndarray, sparse.spmatrix)) and elem.dtype == np.float64:
+        return elem.astype(np.float32)
+    elif isinstance(elem, pd.DataFrame):
+        return elem.astype(
+            {c: np.float32 for c, dt in elem.dtypes.items() if dt == np.float64}
+        )
+    return elem
 
 
 @report_write_key_on_error
@@ -116,23 +205,153 @@ def write_sparse_as_dense(f, key, value, dataset_kwargs=MappingProxyType({})):
         ):  # Write to temporary key before overwriting
             real_key = key
             # Transform key to temporary, e.g. raw/X -> raw/_X, or X -> _X
-            key = re.sub(r"(.*)(\w(?!.*/))", r"\1_\2", key.rstrip("/"))
+            parent, sep, name = key.rstrip("/").rpartition("/")
+            key = f"{parent}{sep}_{name}"
         else:
             del f[key]  # Wipe before write
-    dset = f.create_dataset(key, shape=value.shape, dtype=value.dtype, **dataset_kwargs)
     compressed_axis = int(isinstance(value, sparse.csc_matrix))
-    for idx in idx_chunks_along_axis(value.shape, compressed_axis, 1000):
-        dset[idx] = value[idx].toarray()
+    chunk_size = 1000
+    dataset_kwargs = dict(dataset_kwargs)
+    if 0 not in value.shape:
+        dataset_kwargs.setdefault(
+            "chunks",
+            _slab_aligned_chunks(value.shape, value.dtype, compressed_axis, chunk_size),
+        )
+    if dataset_kwargs.get("compression") is not None:
+        dataset_kwargs.setdefault("shuffle", True)
+    dset = f.create_dataset(key, shape=value.shape, dtype=value.dtype, **dataset_kwargs)
+    # Densify (and for direct chunk writes, compress) slabs in worker threads while
+    # earlier slabs are written. Each slab in flight has its own buffer.
+    # Only arrays written with `as_dense` go through this, other arrays written by
+    # `write_h5ad` are compressed serially by HDF5’s filter pipeline.
+    compress = _direct_chunk_compressor(dset, compressed_axis, chunk_size)
+    n_slabs = -(-value.shape[compressed_axis] // chunk_size)
+    n_workers = max(1, min(_n_workers(), n_slabs))  # No unused buffers
+    buffer_size = (
+        min(chunk_size, value.shape[compressed_axis]) * value.shape[1 - compressed_axis]
+    )
+    buffers = [np.empty(buffer_size, dtype=value.dtype) for _ in range(n_workers)]
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        slabs = idx_chunks_along_axis(value.shape, compressed_axis, chunk_size)
+        for i, idx in enumerate(slabs):
+            if len(pending) >= n_workers:
+                _write_slab(dset, *pending.popleft())
+            # The slab previously densified into this buffer has been written
+            args = value[idx], buffers[i % n_workers]
+            if compress is None:
+                prepared = executor.submit(_densify, *args)
+            else:
+                prepared = executor.submit(_densify_and_compress, *args, idx, compress)
+            pending.append((idx, prepared))
+        while pending:
+            _write_slab(dset, *pending.popleft())
     if real_key is not None:
         del f[real_key]
-        f[real_key] = f[key]
-        del f[key]
+        f.move(key, real_key)
+
+
+def _densify(chunk: sparse.spmatrix, buffer: np.ndarray) -> np.ndarray:
+    """Densify `chunk` into the start of the flat `buffer`."""
+    out = buffer[: chunk.shape[0] * chunk.shape[1]].reshape(chunk.shape)
+    out.fill(0)  # toarray adds to out
+    return chunk.toarray(out=out)
 
 
-def read_h5ad_backed(filename: Union[str, Path], mode: Literal["r", "r+"]) -> AnnData:
-    d = dict(filename=filename, filemode=mode)
+def _write_slab(dset: h5py.Dataset, idx: tuple, prepared: Future):
+    result = prepared.result()
+    if isinstance(result, np.ndarray):
+        dset[idx] = result
+    else:  # Already compressed chunks
+        for offset, data in result:
+            dset.id.write_direct_chunk(offset, data)
 
-    with h5py.File(filename, mode) as f:
+
+class _ChunkCompressor(NamedTuple):
+    """How to encode chunks of a dataset like its HDF5 filter pipeline would."""
+
+    chunks: Tuple[int, int]
+    level: int
+    shuffle: bool
+
+    def __call__(self, chunk: np.ndarray) -> bytes:
+        if chunk.shape != self.chunks:  # Edge chunks are stored at full size
+            padded = np.zeros(self.chunks, dtype=chunk.dtype)
+            padded[: chunk.shape[0], : chunk.shape[1]] = chunk
+            chunk = padded
+        data = np.ascontiguousarray(chunk).view(np.uint8)
+        if self.shuffle:  # Byte-transpose, like the HDF5 shuffle filter
+            data = data.reshape(-1, chunk.dtype.itemsize).T
+        return zlib.compress(np.ascontiguousarray(data), self.level)
+
+
+def _direct_chunk_compressor(
+    dset: h5py.Dataset, axis: int, slab_size: int
+) -> Optional[_ChunkCompressor]:
+    """\
+    Compressor for writing whole chunks of `dset` with `write_direct_chunk`.
+
+    This bypasses HDF5’s filter pipeline, which compresses chunks serially while
+    holding h5py’s lock, so compression (zlib releases the GIL) can run in
+    parallel. Only possible for gzip compression, optionally with shuffle, and if
+    slabs of `slab_size` along `axis` consist of whole chunks. Returns `None` if
+    the dataset needs to be written normally.
+    """
+    if (
+        dset.chunks is None
+        or dset.compression != "gzip"
+        or dset.fletcher32
+        or dset.scaleoffset is not None
+        or dset.dtype.kind not in "biufc"
+    ):
+        return None
+    if slab_size % dset.chunks[axis] != 0 and dset.shape[axis] > slab_size:
+        return None
+    return _ChunkCompressor(dset.chunks, dset.compression_opts, dset.shuffle)
+
+
+def _densify_and_compress(
+    chunk: sparse.spmatrix, buffer: np.ndarray, idx: tuple, compress: _ChunkCompressor
+) -> List[Tuple[Tuple[int, int], bytes]]:
+    """Densify a slab and compress it into `(offset, data)` pairs for each chunk."""
+    dense = _densify(chunk, buffer)
+    start = [s.start or 0 for s in idx]
+    result = []
+    for i in range(0, dense.shape[0], compress.chunks[0]):
+        for j in range(0, dense.shape[1], compress.chunks[1]):
+            block = dense[i : i + compress.chunks[0], j : j + compress.chunks[1]]
+            result.append(((start[0] + i, start[1] + j), compress(block)))
+    return result
+
+
+def _n_workers() -> int:
+    """Number of threads used to convert or compress chunks concurrently."""
+    return min(4, os.cpu_count() or 1)
+
+
+def _slab_aligned_chunks(
+    shape: tuple, dtype: np.dtype, axis: int, slab_size: int
+) -> tuple:
+    """\
+    Chunk shape for writing a 2d array in slabs of `slab_size` along `axis`.
+
+    Chunks span the slab along `axis`, so every write covers whole chunks, and are
+    limited to about 1 MiB by splitting them along the other axis.
+    """
+    along = min(slab_size, shape[axis])
+    across = (1024 * 1024) // (along * np.dtype(dtype).itemsize)
+    across = min(shape[1 - axis], max(1, across))
+    return (along, across) if axis == 0 else (across, along)
+
+
+def read_h5ad_backed(
+    filename: Union[str, Path],
+    mode: Literal["r", "r+"],
+    cache_size: Optional[int] = None,
+) -> AnnData:
+    d = dict(filename=filename, filemode=mode, cache_size=cache_size)
+
+    with h5py.File(filename, mode, **_chunk_cache_kwargs(cache_size)) as f:
         attributes = ["obsm", "varm", "obsp", "varp", "uns", "layers"]
         df_attributes = ["obs", "var"]
 
@@ -153,13 +372,13 @@ def read_h5ad_backed(filename: Union[str, Path], mode: Literal["r", "r+"]) -> An
         elif isinstance(X_dset, h5py.Group):
             d["dtype"] = X_dset["data"].dtype
         elif hasattr(X_dset, "dtype"):
-            d["dtype"] = f["X"].dtype
+            d["dtype"] = X_dset.dtype
         else:
             raise ValueError()
 
         _clean_uns(d)
 
-        return AnnData(**d)
+    return AnnData(**d)
 
 
 def read_h5ad(
@@ -169,6 +388,7 @@ def read_h5ad(
     as_sparse: Sequence[str] = (),
     as_sparse_fmt: Type[sparse.spmatrix] = sparse.csr_matrix,
     chunk_size: int = 6000,  # TODO, probably make this 2d chunks
+    cache_size: Optional[int] = None,
 ) -> AnnData:
     """\
     Read `.h5ad`-formatted hdf5 file.
@@ -191,15 +411,23 @@ def read_h5ad(
         Used only when loading sparse dataset that is stored as dense.
         Loading iterates through chunks of the dataset of this row size
         until it reads the whole dataset.
+        Up to `min(4, os.cpu_count())` chunks are converted concurrently,
+        each in its own dense buffer, so peak memory is about that many times
+        the size of one chunk on top of the resulting sparse matrix.
         Higher size means higher memory consumption and higher (to a point)
         loading speed.
+    cache_size
+        Size of the HDF5 chunk cache in bytes (`rdcc_nbytes` of :class:`h5py.File`).
+        By default, this is at least 16 MiB and large enough that the chunks
+        shared by consecutive `chunk_size` slabs of arrays in `as_sparse`
+        are only read once.
     """
     if backed not in {None, False}:
         mode = backed
         if mode is True:
             mode = "r+"
         assert mode in {"r", "r+"}
-        return read_h5ad_backed(filename, mode)
+        return read_h5ad_backed(filename, mode, cache_size)
 
     if as_sparse_fmt not in (sparse.csr_matrix, sparse.csc_matrix):
         raise NotImplementedError(
@@ -221,31 +449,44 @@ def read_h5ad(
         read_dense_as_sparse, sparse_format=as_sparse_fmt, axis_chunk=chunk_size
     )
 
-    with h5py.File(filename, "r") as f:
+    if cache_size is None:
+        cache_size = _CHUNK_CACHE_MIN_NBYTES
+        if as_sparse:
+            axis = int(as_sparse_fmt == sparse.csc_matrix)
+            with h5py.File(filename, "r") as f:
+                for k in as_sparse:
+                    dset = f.get(k)
+                    if isinstance(dset, h5py.Dataset):
+                        boundary = _slab_boundary_nbytes(dset, axis, chunk_size)
+                        cache_size = max(cache_size, boundary)
+
+    with h5py.File(filename, "r", **_chunk_cache_kwargs(cache_size)) as f:
+        # Look up each top level element only once
+        elems = {k: f[k] for k in f.keys()}
         d = {}
-        for k in f.keys():
+        for k, elem in elems.items():
             # Backwards compat for old raw
             if k == "raw" or k.startswith("raw."):
                 continue
             if k == "X" and "X" in as_sparse:
-                d[k] = rdasp(f[k])
+                d[k] = rdasp(elem)
             elif k == "raw":
                 assert False, "unexpected raw format"
             elif k in {"obs", "var"}:
                 # Backwards compat
-                d[k] = read_dataframe(f[k])
+                d[k] = read_dataframe(elem)
             else:  # Base case
-                d[k] = read_elem(f[k])
+                d[k] = read_elem(elem)
 
         d["raw"] = _read_raw(f, as_sparse, rdasp)
 
-        X_dset = f.get("X", None)
+        X_dset = elems.get("X")
         if X_dset is None:
             pass
         elif isinstance(X_dset, h5py.Group):
             d["dtype"] = X_dset["data"].dtype
         elif hasattr(X_dset, "dtype"):
-            d["dtype"] = f["X"].dtype
+            d["dtype"] = X_dset.dtype
         else:
             raise ValueError()
 
@@ -254,6 +495,26 @@ def read_h5ad(
     return AnnData(**d)
 
 
+def _slab_boundary_nbytes(dataset: h5py.Dataset, axis: int, axis_chunk: int) -> int:
+    """\
+    Bytes of chunk cache needed to read chunks shared by two slabs only once.
+
+    Slabs of `axis_chunk` along `axis` are aligned to the chunks by
+    `_align_to_chunks` and share none, unless a single chunk is larger than
+    `axis_chunk`. Then the cache has to hold one row of chunks spanning `dataset`
+    perpendicular to `axis`, which is what this returns. Otherwise it’s 0.
+    """
+    if dataset.chunks is None or len(dataset.shape) != 2:
+        return 0
+    if dataset.shape[axis] <= axis_chunk:  # Read in a single slab
+        return 0
+    if _align_to_chunks(dataset, axis, axis_chunk) % dataset.chunks[axis] == 0:
+        return 0
+    chunk_nbytes = np.prod(dataset.chunks) * dataset.dtype.itemsize
+    n_across = -(-dataset.shape[1 - axis] // dataset.chunks[1 - axis])
+    return int(chunk_nbytes * n_across)
+
+
 def _read_raw(
     f: Union[h5py.File, AnnDataFileManager],
     as_sparse: Collection[str] = (),
@@ -282,11 +543,7 @@ def read_dataframe_legacy(dataset) -> pd.DataFrame:
         OldFormatWarning,
     )
     if H5PY_V3:
-        df = pd.DataFrame(
-            _decode_structured_array(
-                _from_fixed_length_strings(dataset[()]), dtype=dataset.dtype
-            )
-        )
+        df = pd.DataFrame(_decode_structured_strings(dataset[()], dtype=dataset.dtype))
     else:
         df = pd.DataFrame(_from_fixed_length_strings(dataset[()]))
     df.set_index(df.columns[0], inplace=True)
@@ -303,6 +560,9 @@ def read_dataframe(group) -> pd.DataFrame:
 
 @report_read_key_on_error
 def read_dataset(dataset: h5py.Dataset):
+    if dataset.dtype.kind in "biufc":  # Plain numeric data needs no conversion
+        value = dataset[()]
+        return value[()] if value.shape == () else value
     if H5PY_V3:
         string_dtype = h5py.check_string_dtype(dataset.dtype)
         if (string_dtype is not None) and (string_dtype.encoding == "utf-8"):
@@ -319,10 +579,10 @@ def read_dataset(dataset: h5py.Dataset):
             return value[0]
     elif len(value.dtype.descr) > 1:  # Compound dtype
         # For backwards compat, now strings are written as variable length
-        dtype = value.dtype
-        value = _from_fixed_length_strings(value)
         if H5PY_V3:
-            value = _decode_structured_array(value, dtype=dtype)
+            value = _decode_structured_strings(value)
+        else:
+            value = _from_fixed_length_strings(value)
     if value.shape == ():
         value = value[()]
     return value
@@ -341,17 +601,273 @@ def read_dense_as_sparse(
 
 
 def read_dense_as_csr(dataset, axis_chunk=6000):
-    sub_matrices = []
-    for idx in idx_chunks_along_axis(dataset.shape, 0, axis_chunk):
-        dense_chunk = dataset[idx]
-        sub_matrix = sparse.csr_matrix(dense_chunk)
-        sub_matrices.append(sub_matrix)
-    return sparse.vstack(sub_matrices, format="csr")
+    return _read_dense_as_compressed(dataset, 0, axis_chunk, sparse.csr_matrix)
 
 
 def read_dense_as_csc(dataset, axis_chunk=6000):
-    sub_matrices = []
-    for idx in idx_chunks_along_axis(dataset.shape, 1, axis_chunk):
-        sub_matrix = sparse.csc_matrix(dataset[idx])
-        sub_matrices.append(sub_matrix)
-    return sparse.hstack(sub_matrices, format="csc")
+    return _read_dense_as_compressed(dataset, 1, axis_chunk, sparse.csc_matrix)
+
+
+def _read_dense_as_compressed(
+    dataset: h5py.Dataset,
+    axis: int,
+    axis_chunk: int,
+    sparse_format: Type[sparse.spmatrix],
+) -> sparse.spmatrix:
+    """\
+    Read a dense 2d dataset into a compressed sparse matrix whose major axis is `axis`.
+
+    The non-zero entries of each chunk are written straight into the output arrays.
+    `indptr` has a known size, while `data` and `indices` are grown as needed,
+    using the number of non-zeros seen so far to estimate the final size.
+    Growth is capped at twice the non-zeros seen, so a dense first slab doesn’t
+    lead to allocating a multiple of the final size.
+    """
+    n_major, n_minor = dataset.shape[axis], dataset.shape[1 - axis]
+    if n_major * n_minor <= np.iinfo(np.int32).max:
+        index_dtype = np.int32
+    else:
+        index_dtype = np.int64
+    indptr = np.zeros(n_major + 1, dtype=index_dtype)
+    # Like constructing from a dense array, e.g. float16 becomes float32
+    data = np.empty(0, dtype=_sparse_upcast(dataset.dtype))
+    indices = np.empty(0, dtype=index_dtype)
+    nnz = 0
+    major = 0
+    chunks = _convert_chunks_along_axis(
+        dataset,
+        axis,
+        _align_to_chunks(dataset, axis, axis_chunk),
+        partial(_dense_chunk_nonzero, axis=axis),
+    )
+    for chunk_data, chunk_indices, chunk_counts in chunks:
+        start, nnz = nnz, nnz + len(chunk_data)
+        major_start, major = major, major + len(chunk_counts)
+        if nnz > len(data):
+            estimate = nnz * n_major // major if major else nnz
+            capacity = min(max(estimate, 2 * len(data)), 2 * nnz)
+            data = _grow(data, capacity, start)
+            indices = _grow(indices, capacity, start)
+        data[start:nnz] = chunk_data
+        indices[start:nnz] = chunk_indices
+        indptr[major_start + 1 : major + 1] = start + np.cumsum(chunk_counts)
+    data.resize(nnz, refcheck=False)
+    indices.resize(nnz, refcheck=False)
+    matrix = sparse_format((data, indices, indptr), shape=dataset.shape)
+    matrix.has_sorted_indices = True
+    return matrix
+
+
+def _dense_chunk_nonzero(chunk: np.ndarray, axis: int):
+    """\
+    Find the non-zero entries of a dense chunk, ordered along the major `axis`.
+
+    Returns the values, their minor axis indices, and the count per major axis entry.
+    Works on flat indices into the C-ordered chunk, which are already sorted,
+    so this takes fewer passes over the chunk than `np.nonzero` and fancy indexing.
+    If numba is installed, a compiled loop doing two passes is used instead.
+    """
+    if axis == 1:
+        chunk = chunk.T
+    chunk = np.ascontiguousarray(chunk)
+    compiled = _compiled_dense_chunk_nonzero()
+    if compiled is not None and chunk.dtype in _NUMBA_DTYPES:
+        return compiled(chunk)
+    mask = chunk != 0
+    counts = np.count_nonzero(mask, axis=1)
+    flat = np.flatnonzero(mask)
+    return chunk.ravel()[flat], flat % chunk.shape[1], counts
+
+
+def _dense_chunk_nonzero_loop(chunk: np.ndarray):
+    """Loop version of `_dense_chunk_nonzero` for a C-ordered chunk, for numba."""
+    n_major, n_minor = chunk.shape
+    counts = np.zeros(n_major, dtype=np.int64)
+    for i in range(n_major):
+        for j in range(n_minor):
+            if chunk[i, j] != 0:
+                counts[i] += 1
+    data = np.empty(counts.sum(), dtype=chunk.dtype)
+    indices = np.empty(len(data), dtype=np.int64)
+    k = 0
+    for i in range(n_major):
+        for j in range(n_minor):
+            if chunk[i, j] != 0:
+                data[k] = chunk[i, j]
+                indices[k] = j
+                k += 1
+    return data, indices, counts
+
+
+@lru_cache(maxsize=None)
+def _compiled_dense_chunk_nonzero():
+    """\
+    `_dense_chunk_nonzero_loop` compiled by numba, or `None` if it isn’t installed.
+
+    Compiled without the GIL instead of with `parallel=True`, as chunks are
+    already converted concurrently in a thread pool.
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+    return numba.njit(nogil=True, cache=True)(_dense_chunk_nonzero_loop)
+
+
+def _grow(arr: np.ndarray, capacity: int, n_filled: int) -> np.ndarray:
+    new = np.empty(capacity, dtype=arr.dtype)
+    new[:n_filled] = arr[:n_filled]
+    return new
+
+
+def _align_to_chunks(dataset: h5py.Dataset, axis: int, axis_chunk: int) -> int:
+    """\
+    Round `axis_chunk` down to a multiple of the dataset’s chunking along `axis`.
+
+    Slabs then start and end on chunk boundaries, so each chunk is read and
+    decompressed exactly once. If a single chunk is larger than `axis_chunk`,
+    it is returned unchanged to keep memory usage bounded.
+    """
+    if dataset.chunks is None:
+        return axis_chunk
+    step = dataset.chunks[axis]
+    if step > axis_chunk:
+        return axis_chunk
+    return axis_chunk // step * step
+
+
+def _convert_chunks_along_axis(
+    dataset: h5py.Dataset,
+    axis: int,
+    axis_chunk: int,
+    convert: Callable[[np.ndarray], T],
+    max_workers: Optional[int] = None,
+) -> Iterator[T]:
+    """\
+    Read `dataset` in chunks along `axis`, converting each chunk in a thread pool.
+
+    Chunks are read in the calling thread (h5py serializes access to the file
+    anyway), while conversion of previously read chunks runs concurrently.
+    At most `max_workers` chunks are in flight at once, which bounds memory usage.
+    Results are yielded in order.
+
+    Chunks are read into a fixed set of buffers, one per chunk in flight,
+    so `convert` must not return views of its argument.
+    If possible, HDF5 chunks are read still compressed and decompressed
+    in the thread pool as well, see `_direct_chunk_decoder`.
+    """
+    if max_workers is None:
+        max_workers = _n_workers()
+    n_chunks = -(-dataset.shape[axis] // axis_chunk)
+    max_workers = max(1, min(max_workers, n_chunks))  # No unused buffers
+    decode = _direct_chunk_decoder(dataset, axis, axis_chunk)
+    buffer_shape = list(dataset.shape)
+    buffer_shape[axis] = min(axis_chunk, buffer_shape[axis])
+    buffers = [np.empty(buffer_shape, dtype=dataset.dtype) for _ in range(max_workers)]
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        chunks = idx_chunks_along_axis(dataset.shape, axis, axis_chunk)
+        for i, idx in enumerate(chunks):
+            if len(pending) >= max_workers:
+                yield pending.popleft().result()
+            # The chunk previously read into this buffer has been converted
+            buffer = buffers[i % max_workers]
+            n = len(range(*idx[axis].indices(dataset.shape[axis])))
+            dest_sel = [slice(None)] * len(buffer_shape)
+            dest_sel[axis] = slice(0, n)
+            dest_sel = tuple(dest_sel)
+            out = buffer[dest_sel]
+            if decode is not None and out.size:
+                start = [s.indices(n)[0] for s, n in zip(idx, dataset.shape)]
+                raw = [
+                    (offset, *dataset.id.read_direct_chunk(offset))
+                    for offset in _chunk_offsets(dataset, idx)
+                ]
+                prepared = executor.submit(
+                    _decode_and_convert, raw, out, start, decode, convert
+                )
+            else:
+                if out.size:
+                    dataset.read_direct(buffer, source_sel=idx, dest_sel=dest_sel)
+                prepared = executor.submit(convert, out)
+            pending.append(prepared)
+        while pending:
+            yield pending.popleft().result()
+
+
+class _ChunkDecoder(NamedTuple):
+    """Reverses the HDF5 filter pipeline (deflate and shuffle only) for a chunk."""
+
+    chunks: Tuple[int, int]
+    dtype: np.dtype
+    filters: Tuple[int, ...]
+
+    def __call__(self, data: bytes, filter_mask: int) -> np.ndarray:
+        for i in reversed(range(len(self.filters))):
+            if filter_mask & (1 << i):  # Filter was skipped for this chunk
+                continue
+            if self.filters[i] == h5py.h5z.FILTER_DEFLATE:
+                data = zlib.decompress(data)
+            else:  # Undo the byte-transpose of the shuffle filter
+                data = np.frombuffer(data, dtype=np.uint8)
+                data = data.reshape(self.dtype.itemsize, -1).T.tobytes()
+        return np.frombuffer(data, dtype=self.dtype).reshape(self.chunks)
+
+
+def _direct_chunk_decoder(
+    dset: h5py.Dataset, axis: int, slab_size: int
+) -> Optional[_ChunkDecoder]:
+    """\
+    Decoder for reading whole chunks of `dset` with `read_direct_chunk`.
+
+    The counterpart of `_direct_chunk_compressor`: decompressing in worker threads
+    instead of in HDF5’s filter pipeline lets chunks be decompressed in parallel.
+    Only possible for 2d gzip compressed datasets, optionally with shuffle, where
+    slabs of `slab_size` along `axis` consist of whole chunks that are all stored.
+    Returns `None` if the dataset needs to be read normally.
+    """
+    if (
+        dset.chunks is None
+        or dset.ndim != 2
+        or dset.dtype.kind not in "biufc"
+        or not hasattr(dset.id, "read_direct_chunk")
+        or not hasattr(dset.id, "get_num_chunks")
+    ):
+        return None
+    if slab_size % dset.chunks[axis] != 0 and dset.shape[axis] > slab_size:
+        return None
+    dcpl = dset.id.get_create_plist()
+    filters = tuple(dcpl.get_filter(i)[0] for i in range(dcpl.get_nfilters()))
+    supported = {h5py.h5z.FILTER_DEFLATE, h5py.h5z.FILTER_SHUFFLE}
+    if h5py.h5z.FILTER_DEFLATE not in filters or not supported.issuperset(filters):
+        return None
+    # Chunks that were never written aren’t stored, but read as the fill value
+    n_chunks = np.prod([-(-n // c) for n, c in zip(dset.shape, dset.chunks)])
+    if dset.id.get_num_chunks() != n_chunks:
+        return None
+    return _ChunkDecoder(dset.chunks, dset.dtype, filters)
+
+
+def _chunk_offsets(dset: h5py.Dataset, idx: tuple) -> Iterator[Tuple[int, int]]:
+    """Offsets of the chunks of `dset` covering the chunk-aligned selection `idx`."""
+    (start0, stop0, _), (start1, stop1, _) = (
+        s.indices(n) for s, n in zip(idx, dset.shape)
+    )
+    for i in range(start0, stop0, dset.chunks[0]):
+        for j in range(start1, stop1, dset.chunks[1]):
+            yield i, j
+
+
+def _decode_and_convert(
+    raw: List[Tuple[Tuple[int, int], int, bytes]],
+    out: np.ndarray,
+    start: List[int],
+    decode: _ChunkDecoder,
+    convert: Callable[[np.ndarray], T],
+) -> T:
+    """Decode raw chunks into `out`, which starts at `start`, then convert it."""
+    for offset, filter_mask, data in raw:
+        i, j = offset[0] - start[0], offset[1] - start[1]
+        block = out[i : i + decode.chunks[0], j : j + decode.chunks[1]]
+        block[...] = decode(data, filter_mask)[: block.shape[0], : block.shape[1]]
+    return convert(out)
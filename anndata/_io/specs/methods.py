@@ -25,7 +25,7 @@ from anndata.compat import (
     ZarrGroup,
     _read_attr,
     _from_fixed_length_strings,
-    _decode_structured_array,
+    _decode_structured_strings,
 )
 from anndata._io.utils import report_write_key_on_error, check_key, H5PY_V3
 from anndata._warnings import OldFormatWarning
@@ -384,14 +384,17 @@ def _to_hdf5_vlen_strings(value: np.ndarray) -> np.ndarray:
 
 
 @_REGISTRY.register_read(H5Array, IOSpec("rec-array", "0.2.0"))
-@_REGISTRY.register_read(ZarrArray, IOSpec("rec-array", "0.2.0"))
 def read_recarray(d):
     value = d[()]
-    dtype = value.dtype
-    value = _from_fixed_length_strings(value)
     if H5PY_V3:
-        value = _decode_structured_array(value, dtype=dtype)
-    return value
+        return _decode_structured_strings(value)
+    return _from_fixed_length_strings(value)
+
+
+@_REGISTRY.register_read(ZarrArray, IOSpec("rec-array", "0.2.0"))
+def read_recarray_zarr(d):
+    # Unicode fields are read as object, like variable length strings from h5py
+    return _from_fixed_length_strings(d[()])
 
 
 @_REGISTRY.register_write(H5Group, (np.ndarray, "V"), IOSpec("rec-array", "0.2.0"))
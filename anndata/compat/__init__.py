@@ -41,6 +41,12 @@ except ImportError:
             return "mock zarr.core.Group"
 
 
+try:  # scipy 1.8+
+    from scipy.sparse._sputils import upcast as _sparse_upcast
+except ImportError:
+    from scipy.sparse.sputils import upcast as _sparse_upcast
+
+
 try:
     from zappy.base import ZappyArray
 except ImportError:
@@ -166,6 +172,55 @@ def _decode_structured_array(
     return arr
 
 
+def _decode_structured_strings(
+    arr: np.ndarray, dtype: Optional[np.dtype] = None
+) -> np.ndarray:
+    """\
+    Decode the string fields of a structured array read with h5py 3.
+
+    Does the same as `_from_fixed_length_strings` followed by
+    `_decode_structured_array`, but converts each field with one vectorized call
+    and returns arrays without string fields as they are.
+
+    Params
+    ------
+    arr
+        An array with structured dtype
+    dtype
+        dtype of the array. This is checked for h5py string data types.
+    """
+    if dtype is None:
+        dtype = arr.dtype
+    fields = [(name, dtype.fields[name][0]) for name in dtype.names]
+    if any(dt.subdtype is not None for _, dt in fields):
+        return _decode_structured_array(_from_fixed_length_strings(arr), dtype=dtype)
+
+    decoders = {}
+    for name, dt in fields:
+        if dt.kind == "S":
+            decoders[name] = (
+                f"U{dt.itemsize}",
+                lambda x: np.char.decode(x, "utf-8"),
+            )
+        elif dt.kind == "O":
+            check = h5py.check_string_dtype(dt)
+            if check is not None and check.encoding == "utf-8":
+                decoders[name] = ("O", np.frompyfunc(lambda x: x.decode("utf-8"), 1, 1))
+    if not decoders:
+        return arr
+
+    new_dtype = [
+        (name, decoders[name][0] if name in decoders else dt) for name, dt in fields
+    ]
+    new = np.empty(arr.shape, dtype=new_dtype)
+    for name, _ in fields:
+        if name in decoders:
+            new[name] = decoders[name][1](arr[name])
+        else:
+            new[name] = arr[name]
+    return new
+
+
 def _to_fixed_length_strings(value: np.ndarray) -> np.ndarray:
     """\
     Convert variable length strings to fixed length.
@@ -90,6 +90,20 @@ def test_read_write_X(tmp_path, mtx_format, backed_mode, force_dense):
     assert np.all(asarray(orig.X) == asarray(from_backed.X))
 
 
+def test_backed_cache_size(adata, backing_h5ad):
+    from anndata._core.file_backing import _CHUNK_CACHE_NSLOTS
+
+    adata.write(backing_h5ad)
+    cache_size = 32 * 1024 * 1024
+
+    backed = ad.read_h5ad(backing_h5ad, backed="r", cache_size=cache_size)
+    _, rdcc_nslots, rdcc_nbytes, _ = backed.file._file.id.get_access_plist().get_cache()
+    assert rdcc_nbytes == cache_size
+    assert rdcc_nslots == _CHUNK_CACHE_NSLOTS
+    assert np.all(asarray(adata.X) == asarray(backed.X[()]))
+    backed.file.close()
+
+
 # this is very similar to the views test
 def test_backing(adata, tmp_path, backing_h5ad):
     assert not adata.isbacked
@@ -118,3 +118,150 @@ def test_dense_to_sparse_errors(tmp_path):
         ad.read_h5ad(dense_pth, as_sparse=("X",), as_sparse_fmt=sparse.coo_matrix)
     with pytest.raises(NotImplementedError):
         ad.read_h5ad(dense_pth, as_sparse=("layers/like_X",))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 50, 100])
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_dense_to_sparse_chunked(tmp_path, spmtx_format, chunk_size, compression):
+    dense_path = tmp_path / "dense.h5ad"
+    X = sparse.random(50, 30, density=0.2, format="csr").toarray()
+    X[3] = 0  # an empty row
+    X[:, 5] = 0  # and an empty column
+    orig = ad.AnnData(X=X)
+    orig.write_h5ad(dense_path, compression=compression)
+
+    curr = ad.read_h5ad(
+        dense_path,
+        as_sparse=("X",),
+        as_sparse_fmt=spmtx_format,
+        chunk_size=chunk_size,
+    )
+
+    assert isinstance(curr.X, spmtx_format)
+    assert_equal(orig, curr)
+
+
+@pytest.mark.parametrize("shuffle", [True, False])
+def test_dense_to_sparse_direct_chunks(tmp_path, spmtx_format, shuffle):
+    from anndata._io.h5ad import _direct_chunk_decoder, read_dense_as_sparse
+
+    X = sparse.random(50, 30, density=0.2).toarray().astype(np.float32)
+    with h5py.File(tmp_path / "dense.h5", "w") as f:
+        dset = f.create_dataset(
+            "X", data=X, chunks=(10, 10), compression="gzip", shuffle=shuffle
+        )
+        # A chunk stored with all filters skipped
+        X[:10, :10] = 1
+        dset.id.write_direct_chunk((0, 0), X[:10, :10].tobytes(), filter_mask=0b11)
+
+        axis = int(spmtx_format is sparse.csc_matrix)
+        assert _direct_chunk_decoder(dset, axis, 20) is not None
+        curr = read_dense_as_sparse(dset, spmtx_format, 20)
+    assert isinstance(curr, spmtx_format)
+    np.testing.assert_array_equal(curr.toarray(), X)
+
+
+def test_dense_to_sparse_upcast(tmp_path, spmtx_format):
+    from anndata._io.h5ad import read_dense_as_sparse
+
+    with h5py.File(tmp_path / "dense.h5", "w") as f:
+        dset = f.create_dataset("X", data=np.eye(5, dtype=np.float16))
+        curr = read_dense_as_sparse(dset, spmtx_format, 2)
+    assert curr.dtype == np.float32  # like spmtx_format(dense) does
+    np.testing.assert_array_equal(curr.toarray(), np.eye(5))
+
+
+def test_dense_to_sparse_capacity(tmp_path, monkeypatch):
+    from anndata._io import h5ad
+
+    capacities = []
+    grow = h5ad._grow
+    monkeypatch.setattr(
+        h5ad, "_grow", lambda a, c, n: capacities.append(c) or grow(a, c, n)
+    )
+    X = np.zeros((1000, 20), dtype=np.float32)
+    X[:100] = 1  # Only the first slab has non-zeros
+    with h5py.File(tmp_path / "dense.h5", "w") as f:
+        dset = f.create_dataset("X", data=X)
+        curr = h5ad.read_dense_as_csr(dset, 100)
+    assert curr.nnz == 2000
+    assert max(capacities) <= 2 * curr.nnz
+
+
+def test_slab_boundary_nbytes(tmp_path):
+    from anndata._io.h5ad import _slab_boundary_nbytes
+
+    with h5py.File(tmp_path / "dense.h5", "w") as f:
+        dset = f.create_dataset("X", shape=(200, 30), dtype="f4", chunks=(50, 10))
+        # Slabs are aligned to chunks, or the dataset is read in a single slab
+        assert _slab_boundary_nbytes(dset, 0, 120) == 0
+        assert _slab_boundary_nbytes(dset, 0, 200) == 0
+        # Chunks are larger than slabs, so a row of chunks is shared by two slabs
+        assert _slab_boundary_nbytes(dset, 0, 20) == 50 * 30 * 4
+        assert _slab_boundary_nbytes(dset, 1, 5) == 200 * 10 * 4
+
+
+@pytest.mark.parametrize("shape", [(2500, 20), (20, 2500), (0, 20)])
+def test_sparse_to_dense_multiple_chunks(tmp_path, spmtx_format, shape):
+    pth = tmp_path / "dense.h5ad"
+    orig = ad.AnnData(X=spmtx_format(sparse.random(*shape, density=0.1)))
+    orig.write_h5ad(pth, as_dense=("X",))
+
+    with h5py.File(pth, "r") as f:
+        assert isinstance(f["X"], h5py.Dataset)
+    curr = ad.read_h5ad(pth)
+
+    assert isinstance(curr.X, np.ndarray)
+    assert_equal(orig, curr)
+
+
+def test_sparse_to_dense_chunking(tmp_path, spmtx_format):
+    pth = tmp_path / "dense.h5ad"
+    orig = ad.AnnData(X=spmtx_format(sparse.random(2500, 20, density=0.1)))
+    orig.write_h5ad(pth, as_dense=("X",), compression="gzip")
+
+    with h5py.File(pth, "r") as f:
+        X = f["X"]
+        slab_axis = int(spmtx_format is sparse.csc_matrix)
+        assert X.chunks[slab_axis] == min(1000, X.shape[slab_axis])
+        assert np.prod(X.chunks) * X.dtype.itemsize <= 1024 * 1024
+        assert X.compression == "gzip"
+        assert X.shuffle
+    assert_equal(orig, ad.read_h5ad(pth))
+
+
+@pytest.mark.parametrize("axis", [0, 1])
+@pytest.mark.parametrize(
+    "dtype", ["float64", ">f4", "float16", "longdouble", "clongdouble"]
+)
+def test_dense_chunk_nonzero(axis, dtype):
+    from anndata._io.h5ad import _dense_chunk_nonzero, _dense_chunk_nonzero_loop
+
+    chunk = sparse.random(20, 15, density=0.3).toarray().astype(dtype)
+    chunk[2] = 0
+    expected = (sparse.csr_matrix, sparse.csc_matrix)[axis](chunk)
+    major_first = np.ascontiguousarray(chunk.T if axis else chunk)
+
+    # The loop is what gets compiled with numba, check it without numba as well
+    for data, indices, counts in [
+        _dense_chunk_nonzero(chunk, axis),
+        _dense_chunk_nonzero_loop(major_first),
+    ]:
+        np.testing.assert_array_equal(data, expected.data)
+        np.testing.assert_array_equal(indices, expected.indices)
+        np.testing.assert_array_equal(counts, np.diff(expected.indptr))
+
+
+@pytest.mark.parametrize("chunks", [None, (7, 5), (2500, 3), (300, 20)])
+@pytest.mark.parametrize("shuffle", [True, False])
+def test_sparse_to_dense_compressed(tmp_path, spmtx_format, chunks, shuffle):
+    from anndata._io.h5ad import write_sparse_as_dense
+
+    X = spmtx_format(sparse.random(2500, 20, density=0.1, dtype=np.float32))
+    dataset_kwargs = dict(compression="gzip", shuffle=shuffle)
+    if chunks is not None:
+        dataset_kwargs["chunks"] = chunks
+    with h5py.File(tmp_path / "dense.h5", "w") as f:
+        write_sparse_as_dense(f, "X", X, dataset_kwargs=dataset_kwargs)
+        assert f["X"].shuffle == shuffle
+        np.testing.assert_array_equal(f["X"][()], X.toarray())
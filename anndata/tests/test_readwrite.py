@@ -206,6 +206,73 @@ def test_read_write_maintain_obsmvarm_dtypes(rw):
     assert np.all(orig.varm["df"] == curr.varm["df"])
 
 
+def test_write_downcast_float64(backing_h5ad):
+    orig = gen_adata((10, 8))
+    orig.obsm["f64"] = np.random.random((10, 3))
+    orig.varm["f64"] = csr_matrix(np.random.random((8, 2)))
+    orig.uns["nested"] = dict(f64=np.ones(5), i64=np.arange(5))
+    orig.write(backing_h5ad, downcast_float64=True)
+
+    curr = ad.read(backing_h5ad)
+    assert curr.obsm["f64"].dtype == np.float32
+    assert curr.varm["f64"].dtype == np.float32
+    assert curr.uns["nested"]["f64"].dtype == np.float32
+    assert curr.uns["nested"]["i64"].dtype == np.int64
+    assert (curr.obsm["df"].dtypes != np.float64).all()
+    assert curr.X.dtype == orig.X.dtype
+    np.testing.assert_allclose(curr.obsm["f64"], orig.obsm["f64"], rtol=1e-6)
+    # The object being written is left as is
+    assert orig.obsm["f64"].dtype == np.float64
+
+
+@pytest.mark.parametrize("typ", [np.array, csr_matrix, csc_matrix])
+def test_write_x_dtype(typ, backing_h5ad):
+    orig = ad.AnnData(typ(np.array(X_list, dtype=np.float32)))
+    orig.write(backing_h5ad, x_dtype=np.uint16)
+
+    curr = ad.read(backing_h5ad)
+    assert curr.X.dtype == np.uint16
+    assert type(curr.X) is type(orig.X)
+    assert np.all(asarray(curr.X) == asarray(orig.X))
+    with h5py.File(backing_h5ad, "r") as f:
+        assert _read_attr(f["X"].attrs, "encoding-original-dtype") == "float32"
+
+    orig.X[0, 0] = 0.5
+    with pytest.raises(ValueError, match=r"represented exactly as uint16"):
+        orig.write(backing_h5ad, x_dtype=np.uint16)
+    orig.X[0, 0] = -1
+    with pytest.raises(ValueError, match=r"represented exactly as uint16"):
+        orig.write(backing_h5ad, x_dtype=np.uint16)
+
+
+@pytest.mark.skipif(
+    not ad._io.h5ad._H5PY_ALIGNMENT, reason="h5py doesn’t support alignment"
+)
+def test_write_aligned_datasets(backing_h5ad):
+    adata = ad.AnnData(np.ones((600, 500)))  # A bit over 2 MiB
+    adata.obsm["small"] = np.ones((600, 2))
+    adata.write(backing_h5ad)
+
+    with h5py.File(backing_h5ad, "r") as f:
+        assert f["X"].id.get_offset() % (1024 * 1024) == 0
+    assert_equal(adata, ad.read(backing_h5ad))
+
+
+def test_write_view_raw_categoricals(backing_h5ad):
+    adata = ad.AnnData(
+        np.ones((6, 3)),
+        obs=pd.DataFrame(dict(c=list("aabbcc")), index=list("123456")),
+        var=pd.DataFrame(dict(g=list("aab")), index=list("xyz")),
+    )
+    adata.raw = adata
+    view = adata[:4]
+    view.write(backing_h5ad)
+
+    # Writing the view makes it actual, its new raw has to be converted too
+    assert is_categorical_dtype(view.raw.var["g"])
+    assert is_categorical_dtype(ad.read(backing_h5ad).raw.var["g"])
+
+
 def test_maintain_layers(rw):
     curr, orig = rw
 
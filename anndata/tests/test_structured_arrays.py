@@ -60,3 +60,36 @@ def test_io(tmp_path, diskfmt, diskfmt2):
 
     for (ad1, key1), (ad2, key2) in combinations(product(adatas, keys), 2):
         assert_str_contents_equal(ad1.uns[key1], ad2.uns[key2])
+
+
+def test_read_h5py_string_fields(tmp_path):
+    import h5py
+    from anndata._io.h5ad import read_dataset
+
+    vlen = h5py.string_dtype("utf-8")
+    dtype = np.dtype([("fixed", "S5"), ("vlen", vlen), ("num", "i4")])
+    arr = np.array(
+        [("a", "ä", 1), ("bcdef", "gh", 2)],
+        dtype=[("fixed", "S5"), ("vlen", object), ("num", "i4")],
+    ).astype(dtype)
+    with h5py.File(tmp_path / "test.h5", "w") as f:
+        f.create_dataset("rec", data=arr)
+        f.create_dataset("nums", data=np.zeros(3, dtype=[("a", "f8"), ("b", "i4")]))
+        rec = read_dataset(f["rec"])
+        nums = read_dataset(f["nums"])
+
+    assert rec.dtype["fixed"] == np.dtype("U5")
+    assert list(rec["fixed"]) == ["a", "bcdef"]
+    assert list(rec["vlen"]) == ["ä", "gh"]
+    assert list(rec["num"]) == [1, 2]
+    assert nums.dtype == np.dtype([("a", "f8"), ("b", "i4")])
+
+
+def test_zarr_string_fields_dtype(tmp_path):
+    rec = np.array([("abc", "d")], dtype=[("s", "U3"), ("o", "U1")])
+    initial = AnnData(np.zeros((3, 3)), uns=dict(rec=rec))
+    initial.write_zarr(tmp_path / "test.zarr")
+
+    from_disk = ad.read_zarr(tmp_path / "test.zarr").uns["rec"]
+    assert from_disk.dtype == np.dtype([("s", "O"), ("o", "O")])
+    assert type(from_disk["s"][0]) is str